@@ -1,7 +1,5 @@
 import sys
 import logging
-from PyQt6.QtWidgets import QApplication
-from src.gui.main_window import MainWindow
 
 # Configure logging at application start
 logging.basicConfig(
@@ -9,9 +7,17 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
     force=True  # This ensures our configuration takes precedence
 )
+# Per-line parser and per-pad drawing debug output is far too verbose for normal runs
+logging.getLogger('src.gerber_parser').setLevel(logging.INFO)
+logging.getLogger('src.gui.pcb_view').setLevel(logging.INFO)
 
 def main():
     logging.info("Starting application...")
+    # GUI imports are deferred so logging is configured before Qt and
+    # matplotlib load, and nothing heavy is imported until it is needed
+    from PyQt6.QtWidgets import QApplication
+    from src.gui.main_window import MainWindow
+
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
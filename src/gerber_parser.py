@@ -1,213 +1,346 @@
-from dataclasses import dataclass
-from typing import List, Tuple, Union, Optional
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional
 from shapely.geometry import Polygon, Point
+import shapely
 import numpy as np
 import re
+import os
 import logging
+from array import array
+from collections import Counter
+from functools import lru_cache
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Pre-compiled patterns used on every line of the file
+_FS_RE = re.compile(r'%FSLAX(\d)(\d)Y(\d)(\d)')
+_ADD_RE = re.compile(r'%ADD(\d+)([A-Z]),([\d.]+)(?:X([\d.]+))?')
+
+# Shape codes stored per pad while parsing, indexing into _SHAPE_NAMES
+_CIRCLE = 0
+_RECTANGLE = 1
+_SHAPE_NAMES = ('circle', 'rectangle')
+_APERTURE_SHAPES = {'C': _CIRCLE, 'R': _RECTANGLE}
+
+def _read_buffer_size() -> int:
+    """Buffer size for reading Gerber files, overridable through SVA_READ_BUFFER"""
+    value = os.environ.get('SVA_READ_BUFFER', '')
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return 1 << 16  # 64 KB, well above the 8 KB io default
+
+def _decode(line: bytes) -> str:
+    """Decode a raw Gerber line for parsing or logging"""
+    return line.decode('ascii', 'replace').rstrip()
+
+def _scan_coord(line: bytes) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Scan a coordinate line (e.g., X7550Y3850D03*) into raw (x, y, d_code) integers"""
+    # Tokens always appear in the order X, Y, I, J, D, so each field ends
+    # where the next one starts
+    stop = line.find(b'*')
+    if stop < 0:
+        stop = len(line)
+    d_pos = line.find(b'D', 0, stop)
+    d_code = int(line[d_pos + 1:stop]) if d_pos >= 0 else None
+    if d_pos < 0:
+        d_pos = stop
+
+    # Arc offsets (I/J) sit between the coordinates and the D code
+    coord_end = line.find(b'I', 0, d_pos)
+    if coord_end < 0:
+        coord_end = line.find(b'J', 0, d_pos)
+    if coord_end < 0:
+        coord_end = d_pos
+
+    y_pos = line.find(b'Y', 0, coord_end)
+    y = int(line[y_pos + 1:coord_end]) if y_pos >= 0 else None
+    x_end = y_pos if y_pos >= 0 else coord_end
+    x_pos = line.find(b'X', 0, x_end)
+    x = int(line[x_pos + 1:x_end]) if x_pos >= 0 else None
+    return x, y, d_code
+
+# Slotted: boards can hold many thousands of pads, and slots drop the
+# per-instance __dict__
+@dataclass(slots=True)
 class PadInfo:
     """Represents a pad with its properties and calculated volumes"""
     id: int
     shape_type: str  # 'circle', 'rectangle', 'polygon'
     coordinates: Tuple[float, float]
-    geometry: Union[Point, Polygon]
+    outline: Polygon  # aperture outline centred on the origin, shared by every flash of it
     area: float
     volume: float
     thickness: float = 0.15  # default 150 microns
     length: float = 0.0      # longest dimension
     width: float = 0.0       # shortest dimension
-    
-    def calculate_dimensions(self):
-        """Calculate pad dimensions based on geometry"""
-        if self.shape_type == 'circle':
-            # For circles, length and width are the diameter
-            self.length = self.width = 2 * self.geometry.buffer(0).boundary.distance(self.geometry.centroid)
-        else:
-            # For rectangles and polygons, calculate using bounds
-            minx, miny, maxx, maxy = self.geometry.bounds
-            self.length = max(maxx - minx, maxy - miny)
-            self.width = min(maxx - minx, maxy - miny)
+    radius: float = 0.0      # circles only, taken from the aperture
+    bounds: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)  # (minx, miny, maxx, maxy) on the board
+    _geometry: Optional[Polygon] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def geometry(self) -> Polygon:
+        """Pad outline at its board position, built from the shared aperture outline on first use"""
+        if self._geometry is None:
+            self._geometry = shapely.polygons(shapely.get_coordinates(self.outline) + self.coordinates)
+        return self._geometry
+
+def _aperture_outline(shape: Optional[int], width: float, height: float) -> Optional[Polygon]:
+    """Build the outline of an aperture centred on the origin"""
+    if shape == _CIRCLE:
+        return Point(0, 0).buffer(width / 2)
+    if shape == _RECTANGLE:
+        return shapely.box(-width / 2, -height / 2, width / 2, height / 2)
+    return None
 
 class GerberParser:
     def __init__(self):
-        self.pads: List[PadInfo] = []
+        self._pads: Optional[List[PadInfo]] = None
         self._pad_counter = 0
+        # Parsed pads, stored column-wise until PadInfo records are requested
+        self._xs = array('d')
+        self._ys = array('d')
+        self._widths = array('d')
+        self._heights = array('d')
+        self._shapes = array('B')
+        self._outlines: List[Polygon] = []  # shared per-aperture outlines, one reference per pad
         self._current_aperture = None
         self._apertures = {}  # Dictionary to store aperture definitions
         self._scale = 1.0  # For unit conversion
         self._current_x = 0.0
         self._current_y = 0.0
+        self._debug = False  # Cached per parse so hot paths skip building debug messages
+        # Line handlers keyed by the first byte of a line
+        self._dispatch = {
+            ord('%'): self._parse_extended,
+            ord('D'): self._parse_operation,
+            ord('X'): self._parse_coordinate,
+            ord('Y'): self._parse_coordinate,
+        }
+
+    @property
+    def pads(self) -> List[PadInfo]:
+        """Parsed pads, built from the raw pad arrays on first access"""
+        if self._pads is None:
+            self._pads = self._build_pads()
+        return self._pads
 
     def parse_file(self, filepath: str) -> List[PadInfo]:
         """Parse a Gerber file and extract pad information"""
         try:
-            logging.info(f"Starting to parse Gerber file: {filepath}")
-            with open(filepath, 'r') as f:
-                lines = f.readlines()
-            
-            logging.info(f"Read {len(lines)} lines from file")
-
-            # Process each line in the file
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                logging.debug(f"Processing line {line_num}: {line}")
-
-                # Parse format specification
-                if line.startswith('%FSLAX'):
-                    logging.info(f"Found format specification: {line}")
-                    self._parse_format(line)
-                # Parse aperture definition
-                elif line.startswith('%ADD'):
-                    logging.info(f"Found aperture definition: {line}")
-                    self._parse_aperture(line)
-                # Parse operation
-                elif line.startswith('D'):
-                    logging.debug(f"Found operation: {line}")
-                    self._parse_operation(line)
-                # Parse coordinate
-                elif re.match(r'^[XY]', line):
-                    logging.debug(f"Found coordinate: {line}")
-                    self._parse_coordinate(line)
-
-            logging.info(f"Finished parsing. Found {len(self.pads)} pads.")
+            logger.info(f"Starting to parse Gerber file: {filepath}")
+            self._debug = debug = logger.isEnabledFor(logging.DEBUG)
+            self._pads = None
+            line_num = 0
+            dispatch = self._dispatch
+            # Gerber is plain ASCII, so lines are handled as bytes and only the
+            # rare extended/operation lines are ever decoded
+            with open(filepath, 'rb', buffering=_read_buffer_size()) as f:
+                # Process each line as it is read from the file, routing it on
+                # its first byte
+                for line_num, line in enumerate(f, 1):
+                    handler = dispatch.get(line[0])
+                    if handler is None:
+                        # Only indented or blank lines need stripping
+                        line = line.strip()
+                        if not line:
+                            continue
+                        handler = dispatch.get(line[0])
+                        if handler is None:
+                            continue
+
+                    if debug:
+                        logger.debug(f"Processing line {line_num}: {_decode(line)}")
+                    handler(line)
+
+            shape_counts = Counter(pad.shape_type for pad in self.pads)
+            logger.info(f"Finished parsing {line_num} lines. Found {len(self.pads)} pads: {dict(shape_counts)}")
             return self.pads
         except Exception as e:
-            logging.error(f"Error parsing Gerber file: {str(e)}", exc_info=True)
+            logger.error(f"Error parsing Gerber file: {str(e)}", exc_info=True)
             raise Exception(f"Error parsing Gerber file: {str(e)}")
 
+    def _parse_extended(self, line: bytes):
+        """Parse an extended command (e.g., %FSLAX36Y36*% or %ADD10C,0.0100*%)"""
+        line = _decode(line)
+        # Parse format specification
+        if line.startswith('%FSLAX'):
+            logger.info(f"Found format specification: {line}")
+            self._parse_format(line)
+        # Parse aperture definition
+        elif line.startswith('%ADD'):
+            logger.info(f"Found aperture definition: {line}")
+            self._parse_aperture(line)
+
     def _parse_format(self, line: str):
         """Parse format specification (e.g., %FSLAX36Y36*%)"""
-        match = re.match(r'%FSLAX(\d)(\d)Y(\d)(\d)', line)
+        match = _FS_RE.match(line)
         if match:
             x_int, x_dec, y_int, y_dec = map(int, match.groups())
             self._scale = 10 ** -x_dec  # Use X decimal places for scaling
-            logging.info(f"Set scale to {self._scale} (x_int={x_int}, x_dec={x_dec}, y_int={y_int}, y_dec={y_dec})")
+            logger.info(f"Set scale to {self._scale} (x_int={x_int}, x_dec={x_dec}, y_int={y_int}, y_dec={y_dec})")
         else:
-            logging.warning(f"Could not parse format specification: {line}")
+            logger.warning(f"Could not parse format specification: {line}")
 
     def _parse_aperture(self, line: str):
-        """Parse aperture definition (e.g., %ADD10C,0.0100*%)"""
-        match = re.match(r'%ADD(\d+)([A-Z]),([\d.]+)', line)
+        """Parse aperture definition (e.g., %ADD10C,0.0100*% or %ADD11R,0.0200X0.0100*%)"""
+        match = _ADD_RE.match(line)
         if match:
-            number, type_, size = match.groups()
+            number, type_, size, size_y = match.groups()
+            shape = _APERTURE_SHAPES.get(type_)
+            width = float(size)
+            # For rectangles the X modifier is the Y size; for circles it is a hole
+            height = float(size_y) if size_y and type_ == 'R' else width
             self._apertures[number] = {
                 'type': type_,
-                'size': float(size)
+                'size': width,
+                # Resolved once here so each flash is a plain lookup
+                'shape': shape,
+                'width': width,
+                'height': height,
+                'outline': _aperture_outline(shape, width, height),
             }
-            logging.info(f"Added aperture {number}: type={type_}, size={size}")
+            logger.info(f"Added aperture {number}: type={type_}, size={size}")
         else:
-            logging.warning(f"Could not parse aperture definition: {line}")
+            logger.warning(f"Could not parse aperture definition: {line}")
 
-    def _parse_operation(self, line: str):
+    def _parse_operation(self, line: bytes):
         """Parse operation code (e.g., D03*)"""
-        if not line.startswith('D'):
-            return
-            
-        # Extract the operation code (remove trailing *)
-        code = line[1:].rstrip('*')
+        # Extract the operation code (remove trailing * and line ending)
+        code = _decode(line[1:]).rstrip('*')
+        if self._debug:
+            logger.debug(f"Found operation: {_decode(line)}")
         
         if code.isdigit():
             # Aperture selection
             self._current_aperture = code
-            logging.debug(f"Selected aperture: {code}")
+            if self._debug:
+                logger.debug(f"Selected aperture: {code}")
         elif code == '03':
             # Flash (create pad)
-            logging.info(f"Creating pad at ({self._current_x}, {self._current_y}) with aperture {self._current_aperture}")
             self._create_pad()
         elif code == '02':
             # Move operation (no pad creation)
-            logging.debug("Move operation")
+            if self._debug:
+                logger.debug("Move operation")
         elif code == '01':
             # Linear interpolation (no pad creation)
-            logging.debug("Linear interpolation")
+            if self._debug:
+                logger.debug("Linear interpolation")
 
-    def _parse_coordinate(self, line: str):
+    def _parse_coordinate(self, line: bytes):
         """Parse coordinate (e.g., X7550Y3850D03*)"""
-        # Remove any trailing operations (D01, D02, D03)
-        coord_part = re.sub(r'D\d+\*?$', '', line)
-        
-        x_match = re.search(r'X([-\d]+)', coord_part)
-        y_match = re.search(r'Y([-\d]+)', coord_part)
+        if self._debug:
+            logger.debug(f"Found coordinate: {_decode(line)}")
+        try:
+            x, y, d_code = _scan_coord(line)
+        except ValueError:
+            logger.warning(f"Could not parse coordinate: {_decode(line)}")
+            return
         
         old_x, old_y = self._current_x, self._current_y
         
-        if x_match:
-            self._current_x = float(x_match.group(1)) * self._scale
-        if y_match:
-            self._current_y = float(y_match.group(1)) * self._scale
+        if x is not None:
+            self._current_x = x * self._scale
+        if y is not None:
+            self._current_y = y * self._scale
             
-        if old_x != self._current_x or old_y != self._current_y:
-            logging.debug(f"Updated coordinates: ({self._current_x}, {self._current_y})")
+        if self._debug and (old_x != self._current_x or old_y != self._current_y):
+            logger.debug(f"Updated coordinates: ({self._current_x}, {self._current_y})")
             
         # Check if this coordinate includes a flash operation
-        if 'D03' in line:
-            logging.info(f"Coordinate includes flash operation")
+        if d_code == 3:
             self._create_pad()
 
     def _create_pad(self):
-        """Create a pad at the current position using current aperture"""
+        """Record a pad at the current position using current aperture"""
         if not self._current_aperture:
-            logging.warning("No aperture selected, cannot create pad")
+            logger.warning("No aperture selected, cannot create pad")
             return
         if self._current_aperture not in self._apertures:
-            logging.warning(f"Selected aperture {self._current_aperture} not found in definitions")
+            logger.warning(f"Selected aperture {self._current_aperture} not found in definitions")
             return
 
         aperture = self._apertures[self._current_aperture]
-        logging.info(f"Creating pad with aperture {self._current_aperture} ({aperture['type']})")
-
-        if aperture['type'] == 'C':  # Circle
-            # Create circular pad
-            radius = aperture['size'] / 2
-            point = Point(self._current_x, self._current_y)
-            area = np.pi * radius * radius
-            volume = area * 0.15  # Default thickness
-
-            self._pad_counter += 1
-            pad = PadInfo(
-                id=self._pad_counter,
-                shape_type='circle',
-                coordinates=(self._current_x, self._current_y),
-                geometry=point.buffer(radius),
-                area=area,
-                volume=volume
-            )
-            pad.calculate_dimensions()
-            self.pads.append(pad)
-            logging.info(f"Created circular pad {self._pad_counter} at ({self._current_x}, {self._current_y})")
-
-        elif aperture['type'] == 'R':  # Rectangle
-            # Create rectangular pad
-            size = aperture['size']
-            half_size = size / 2
-            coords = [
-                (self._current_x - half_size, self._current_y - half_size),
-                (self._current_x + half_size, self._current_y - half_size),
-                (self._current_x + half_size, self._current_y + half_size),
-                (self._current_x - half_size, self._current_y + half_size),
-            ]
-            geometry = Polygon(coords)
-            area = size * size
-            volume = area * 0.15  # Default thickness
-
-            self._pad_counter += 1
-            pad = PadInfo(
-                id=self._pad_counter,
-                shape_type='rectangle',
-                coordinates=(self._current_x, self._current_y),
-                geometry=geometry,
+        shape = aperture['shape']
+        if shape is None:
+            logger.warning(f"Unsupported aperture type: {aperture['type']}")
+            return
+
+        # Only raw values are stored here; PadInfo records are built in bulk
+        # once parsing is done
+        self._pad_counter += 1
+        self._xs.append(self._current_x)
+        self._ys.append(self._current_y)
+        self._widths.append(aperture['width'])
+        self._heights.append(aperture['height'])
+        self._shapes.append(shape)
+        self._outlines.append(aperture['outline'])
+        if self._debug:
+            logger.debug(f"Created {_SHAPE_NAMES[shape]} pad {self._pad_counter} at ({self._current_x}, {self._current_y})")
+
+    def _build_pads(self) -> List[PadInfo]:
+        """Materialise PadInfo records from the parsed pad arrays"""
+        if not self._shapes:
+            return []
+
+        xs = np.frombuffer(self._xs, dtype=np.float64)
+        ys = np.frombuffer(self._ys, dtype=np.float64)
+        widths = np.frombuffer(self._widths, dtype=np.float64)
+        heights = np.frombuffer(self._heights, dtype=np.float64)
+        shapes = np.frombuffer(self._shapes, dtype=np.uint8)
+
+        is_circle = shapes == _CIRCLE
+
+        # Areas and volumes for all pads in one vectorized pass
+        half_widths = widths / 2
+        areas = np.where(is_circle, np.pi * half_widths * half_widths, widths * heights)
+        volumes = areas * 0.15  # Default thickness
+        # Dimensions come straight from the aperture sizes
+        lengths = np.maximum(widths, heights)
+        min_widths = np.minimum(widths, heights)
+        radii = np.where(is_circle, half_widths, 0.0)
+        # Bounding boxes follow from the centre and aperture size; zipping the
+        # columns yields each (minx, miny, maxx, maxy) tuple without a per-pad call
+        half_heights = heights / 2
+        bounds = zip((xs - half_widths).tolist(), (ys - half_heights).tolist(),
+                     (xs + half_widths).tolist(), (ys + half_heights).tolist())
+
+        # Build the records in a single sized comprehension rather than growing a list
+        return [
+            PadInfo(
+                id=pad_id,
+                shape_type=_SHAPE_NAMES[shape],
+                coordinates=(x, y),
+                outline=outline,
                 area=area,
-                volume=volume
+                volume=volume,
+                length=length,
+                width=width,
+                radius=radius,
+                bounds=pad_bounds
             )
-            pad.calculate_dimensions()
-            self.pads.append(pad)
-            logging.info(f"Created rectangular pad {self._pad_counter} at ({self._current_x}, {self._current_y})")
-        else:
-            logging.warning(f"Unsupported aperture type: {aperture['type']}")
+            for pad_id, (x, y, shape, outline, area, volume, length, width, radius, pad_bounds) in enumerate(
+                zip(xs.tolist(), ys.tolist(), shapes.tolist(), self._outlines, areas.tolist(),
+                    volumes.tolist(), lengths.tolist(), min_widths.tolist(), radii.tolist(),
+                    bounds), 1)
+        ]
+
+@lru_cache(maxsize=4)
+def _parse_cached(filepath: str, mtime_ns: int, size: int) -> Tuple[PadInfo, ...]:
+    """Parse a file once per (path, mtime, size); the stat values only key the cache"""
+    return tuple(GerberParser().parse_file(filepath))
+
+def parse_gerber_file(filepath: str) -> List[PadInfo]:
+    """Parse a Gerber file, reusing the previous result while the file is unchanged
+
+    The PadInfo records are shared with the cache and with every other caller
+    that loaded the same file, so they must be treated as read-only.
+    """
+    try:
+        stat = os.stat(filepath)
+    except OSError as e:
+        logger.error(f"Error parsing Gerber file: {str(e)}")
+        raise Exception(f"Error parsing Gerber file: {str(e)}")
+    # Only the list is per caller, so it can be reordered or trimmed freely;
+    # the records in it are the cached ones
+    return list(_parse_cached(filepath, stat.st_mtime_ns, stat.st_size))
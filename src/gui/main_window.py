@@ -1,21 +1,50 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QPushButton, QFileDialog, QLabel, QTableWidget, QMessageBox,
                             QStatusBar, QSplitter)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QGuiApplication
 from src.gui.pcb_view import PCBView
 from src.gui.volume_table import VolumeTable
-from src.gerber_parser import GerberParser
+from src.gerber_parser import parse_gerber_file
+import numpy as np
 import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+# File dialog filters
+_GERBER_FILTER = "Gerber Files (*.gbr *.ger);;All Files (*.*)"
+_EXPORT_FILTER = "Excel Files (*.xlsx);;CSV Files (*.csv);;All Files (*.*)"
+
+class ParseWorker(QObject):
+    """Parses a Gerber file on a worker thread"""
+    finished = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+
+    @pyqtSlot()
+    def run(self):
+        """Parse the file and report the pads or the error back to the GUI thread"""
+        try:
+            pads = parse_gerber_file(self.file_path)
+        except Exception as e:
+            self.error.emit(str(e))
+        else:
+            self.finished.emit(pads)
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Gerber Solder Volume Analyzer")
         
         # Initialize components
-        self.gerber_parser = GerberParser()
         self.current_file = None
+        self._parse_thread = None
+        self._parse_worker = None
+        self._previous_status = ""
         
         # Create main widget and layout
         main_widget = QWidget()
@@ -54,9 +83,9 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(button_layout)
         
         # Add load button
-        load_button = QPushButton("Load Gerber File")
-        load_button.clicked.connect(self._load_gerber_file)
-        button_layout.addWidget(load_button)
+        self.load_button = QPushButton("Load Gerber File")
+        self.load_button.clicked.connect(self._load_gerber_file)
+        button_layout.addWidget(self.load_button)
         
         # Add export button
         export_button = QPushButton("Export Data")
@@ -95,37 +124,88 @@ class MainWindow(QMainWindow):
     def _load_gerber_file(self):
         """Handle Gerber file loading"""
         try:
-            logging.info("Opening file dialog...")
+            logger.info("Opening file dialog...")
             file_path, _ = QFileDialog.getOpenFileName(
                 self,
                 "Open Gerber File",
                 "",
-                "Gerber Files (*.gbr *.ger);;All Files (*.*)"
+                _GERBER_FILTER
             )
 
             if file_path:
                 self.current_file = file_path
-                logging.info(f"Selected file: {file_path}")
+                logger.info(f"Selected file: {file_path}")
                 # Parse Gerber file
-                logging.info("Starting to parse file...")
-                pads = self.gerber_parser.parse_file(file_path)
-                logging.info(f"Successfully parsed {len(pads)} pads")
-                
-                # Update PCB view
-                logging.info("Updating PCB view...")
-                self.pcb_view.set_pads(pads)
-                
-                # Update volume table
-                logging.info("Updating volume table...")
-                self.volume_table.update_data(pads)
-                
-                # Update status
-                self._update_status(pads)
-                logging.info("GUI update complete")
+                logger.info("Starting to parse file...")
+                self._start_parse(file_path)
+        except Exception as e:
+            logger.error(f"Error loading Gerber file: {str(e)}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Failed to load Gerber file: {str(e)}")
+
+    def _start_parse(self, file_path: str):
+        """Parse a Gerber file on a worker thread so the GUI stays responsive"""
+        # Only one parse at a time
+        self.load_button.setEnabled(False)
+        self._previous_status = self.statusBar.currentMessage()
+        self.statusBar.showMessage(f"Parsing {os.path.basename(file_path)}...")
+
+        self._parse_thread = QThread(self)
+        self._parse_worker = ParseWorker(file_path)
+        self._parse_worker.moveToThread(self._parse_thread)
+        self._parse_thread.started.connect(self._parse_worker.run)
+        self._parse_worker.finished.connect(self._on_pads_ready)
+        self._parse_worker.error.connect(self._on_parse_error)
+        self._parse_worker.finished.connect(self._parse_thread.quit)
+        self._parse_worker.error.connect(self._parse_thread.quit)
+        self._parse_thread.finished.connect(self._parse_worker.deleteLater)
+        self._parse_thread.finished.connect(self._parse_thread.deleteLater)
+        self._parse_thread.finished.connect(self._on_parse_thread_finished)
+        self._parse_thread.start()
+
+    def _on_parse_thread_finished(self):
+        """Drop the references to the worker and thread, both scheduled for deletion"""
+        self._parse_thread = None
+        self._parse_worker = None
+
+    def _on_pads_ready(self, pads):
+        """Update the views with freshly parsed pads"""
+        self.load_button.setEnabled(True)
+        try:
+            logger.info(f"Successfully parsed {len(pads)} pads")
+            
+            # Update PCB view
+            logger.info("Updating PCB view...")
+            self.pcb_view.set_pads(pads)
+            
+            # Update volume table
+            logger.info("Updating volume table...")
+            self.volume_table.update_data(pads)
+            
+            # Update status
+            self._update_status(pads)
+            logger.info("GUI update complete")
         except Exception as e:
-            logging.error(f"Error loading Gerber file: {str(e)}", exc_info=True)
+            logger.error(f"Error loading Gerber file: {str(e)}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Failed to load Gerber file: {str(e)}")
+
+    def _on_parse_error(self, message: str):
+        """Report a failed parse"""
+        self.load_button.setEnabled(True)
+        self.statusBar.showMessage(self._previous_status)
+        QMessageBox.critical(self, "Error", f"Failed to load Gerber file: {message}")
     
+    def closeEvent(self, event):
+        """Wait for a running parse before the window and its thread are destroyed"""
+        if self._parse_thread is not None and self._parse_thread.isRunning():
+            logger.info("Waiting for the running parse to finish before closing")
+            # The result is no longer wanted once the window is closing
+            self._parse_worker.finished.disconnect(self._on_pads_ready)
+            self._parse_worker.error.disconnect(self._on_parse_error)
+            self._parse_thread.quit()
+            self._parse_thread.wait()
+            self._on_parse_thread_finished()
+        super().closeEvent(event)
+
     def _export_data(self):
         """Handle data export"""
         try:
@@ -133,7 +213,7 @@ class MainWindow(QMainWindow):
                 self,
                 "Export Data",
                 "",
-                "Excel Files (*.xlsx);;CSV Files (*.csv);;All Files (*.*)"
+                _EXPORT_FILTER
             )
             
             if file_path:
@@ -149,7 +229,8 @@ class MainWindow(QMainWindow):
             return
             
         # Calculate total volume
-        total_volume = sum(pad.volume for pad in pads)
+        volumes = np.fromiter((pad.volume for pad in pads), dtype=np.float64, count=len(pads))
+        total_volume = float(volumes.sum())
         
         # Create status message
         file_name = os.path.basename(self.current_file) if self.current_file else "No file"
@@ -159,7 +240,8 @@ class MainWindow(QMainWindow):
     def _center_window(self):
         """Center the window on the screen"""
         frame_geometry = self.frameGeometry()
-        screen = self.screen()
+        # Before the window is shown it may not be on a screen yet
+        screen = self.screen() or QGuiApplication.primaryScreen()
         if screen:
             center_point = screen.availableGeometry().center()
             frame_geometry.moveCenter(center_point)
@@ -1,8 +1,8 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-from matplotlib.patches import Circle, Rectangle, Polygon
+from matplotlib.collections import PolyCollection, EllipseCollection
 import matplotlib.colors as mcolors
 from matplotlib.cm import ScalarMappable
 import numpy as np
@@ -10,10 +10,36 @@ from typing import List, Optional
 import logging
 from src.gerber_parser import PadInfo
 
+logger = logging.getLogger(__name__)
+
 class PCBView(QWidget):
     def __init__(self):
         super().__init__()
         self.pads: List[PadInfo] = []
+        self.pad_bounds = np.empty((0, 4), dtype=np.float32)  # per-pad (xmin, ymin, xmax, ymax)
+        # Pad data stored column-wise, one row per entry in self.pads.
+        # Geometry is single precision: ample for drawing and view culling,
+        # and half the memory traffic of float64
+        self._centres = np.empty((0, 2), dtype=np.float32)
+        self._radii = np.empty(0, dtype=np.float32)
+        self._volumes = np.empty(0)
+        self._is_circle = np.empty(0, dtype=bool)
+        self._is_rectangle = np.empty(0, dtype=bool)
+        self._is_polygon = np.empty(0, dtype=bool)
+        # Outline vertices, built once per load: a (rectangles, 4, 2) block of
+        # corners with each pad's row in it, and polygon exteriors keyed by pad index
+        self._rect_outlines = np.empty((0, 4, 2), dtype=np.float32)
+        self._rect_rows = np.empty(0, dtype=np.intp)
+        self._polygon_outlines = {}
+        self._bounds_cache = None  # overall (xmin, ymin, xmax, ymax), reset by set_pads
+        self._colorbar = None  # created on first draw, then only rescaled
+        # Pad collections currently on the axes and the pad mask they were built from
+        self._pad_collections = []
+        self._visible = None
+        # Colour mapping shared by the pad collections and the colorbar; only
+        # the norm's range changes between draws
+        self._cmap = mcolors.LinearSegmentedColormap.from_list("", ["lightblue", "darkblue"])
+        self._norm = mcolors.Normalize()
         self.selected_pad: Optional[int] = None
         
         # Setup matplotlib figure
@@ -35,6 +61,12 @@ class PCBView(QWidget):
         # Pan and zoom state
         self._pan_start = None
         self._is_panning = False
+
+        # Pan and zoom redraws are throttled to roughly one per frame (~60 fps)
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self._redraw)
         
         # Initialize view
         self._setup_plot()
@@ -48,10 +80,39 @@ class PCBView(QWidget):
         
     def set_pads(self, pads: List[PadInfo]):
         """Update the view with new pad data"""
-        logging.info(f"Setting {len(pads)} pads in PCB view")
+        logger.info("Setting %d pads in PCB view", len(pads))
         self.pads = pads
+        count = len(pads)
+        self.pad_bounds = np.array([pad.bounds for pad in pads], dtype=np.float32).reshape(-1, 4)
+        self._centres = np.array([pad.coordinates for pad in pads], dtype=np.float32).reshape(-1, 2)
+        self._radii = np.fromiter((pad.radius for pad in pads), dtype=np.float32, count=count)
+        self._volumes = np.fromiter((pad.volume for pad in pads), dtype=np.float64, count=count)
+        self._is_circle = np.fromiter((pad.shape_type == 'circle' for pad in pads), dtype=bool, count=count)
+        self._is_rectangle = np.fromiter((pad.shape_type == 'rectangle' for pad in pads), dtype=bool, count=count)
+        self._is_polygon = np.fromiter((pad.shape_type == 'polygon' for pad in pads), dtype=bool, count=count)
+        self._build_outlines()
+        self._bounds_cache = None
         self._draw_pads()
         self.fit_view()
+
+    def _build_outlines(self):
+        """Precompute the outline vertices of rectangle and polygon pads"""
+        # Corners of the rectangle pads only; _rect_rows maps a pad index to
+        # its row in the block and is only meaningful for rectangles
+        minx, miny, maxx, maxy = self.pad_bounds[self._is_rectangle].T
+        self._rect_outlines = np.stack((
+            np.column_stack((minx, miny)),
+            np.column_stack((maxx, miny)),
+            np.column_stack((maxx, maxy)),
+            np.column_stack((minx, maxy)),
+        ), axis=1)
+        self._rect_rows = np.cumsum(self._is_rectangle) - 1
+
+        # Polygons have varying vertex counts, so they are kept one by one
+        self._polygon_outlines = {
+            index: np.array(self.pads[index].geometry.exterior.coords, dtype=np.float32)
+            for index in np.flatnonzero(self._is_polygon).tolist()
+        }
         
     def zoom_in(self):
         """Zoom in on the plot center"""
@@ -84,7 +145,19 @@ class PCBView(QWidget):
         
         # Maintain aspect ratio
         self.ax.set_aspect('equal')
-        self.figure.canvas.draw_idle()
+        self._schedule_redraw()
+        
+    def _redraw(self):
+        """Bring the drawn pads in line with the current view and redraw"""
+        self._update_visible_pads()
+        self.canvas.draw_idle()
+
+    def _schedule_redraw(self):
+        """Request a redraw, at most one per timer interval during pan and zoom"""
+        # The timer is not restarted while pending, so a continuous drag still
+        # repaints every interval instead of waiting for the mouse to stop
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
         
     def _on_scroll(self, event):
         """Handle mouse wheel scrolling for zoom"""
@@ -120,8 +193,10 @@ class PCBView(QWidget):
         # Update the view limits
         self.ax.set_xlim(self.ax.get_xlim() - dx)
         self.ax.set_ylim(self.ax.get_ylim() - dy)
-        
-        self.canvas.draw()
+
+        # Schedule rather than force a redraw so bursts of mouse events
+        # collapse into one repaint
+        self._schedule_redraw()
         
         # Update the start position for the next movement
         self._pan_start = (event.xdata, event.ydata)
@@ -135,99 +210,127 @@ class PCBView(QWidget):
         """Fit the view to show all pads"""
         if not self.pads:
             return
+
+        if self._bounds_cache is None:
+            min_x, min_y = self.pad_bounds[:, :2].min(axis=0)
+            max_x, max_y = self.pad_bounds[:, 2:].max(axis=0)
+            self._bounds_cache = (float(min_x), float(min_y), float(max_x), float(max_y))
+        min_x, min_y, max_x, max_y = self._bounds_cache
+        padding = 0.1 * (max_x - min_x)
+        self.ax.set_xlim(min_x - padding, max_x + padding)
+        self.ax.set_ylim(min_y - padding, max_y + padding)
+        self._update_visible_pads()
+        self.canvas.draw_idle()
             
-        x_coords = []
-        y_coords = []
-        
-        for pad in self.pads:
-            bounds = pad.geometry.bounds
-            x_coords.extend([bounds[0], bounds[2]])
-            y_coords.extend([bounds[1], bounds[3]])
-            
-        if x_coords and y_coords:
-            padding = 0.1 * (max(x_coords) - min(x_coords))
-            self.ax.set_xlim(min(x_coords) - padding, max(x_coords) + padding)
-            self.ax.set_ylim(min(y_coords) - padding, max(y_coords) + padding)
-            self.canvas.draw()
-            
+    def _remove_pad_collections(self):
+        """Take the current pad collections off the axes"""
+        for collection in self._pad_collections:
+            collection.remove()
+        self._pad_collections = []
+
+    def _update_visible_pads(self):
+        """Rebuild the pad collections from the pads overlapping the current view"""
+        if not self.pads:
+            return
+
+        # Only pads whose bounds overlap the view limits are handed to
+        # matplotlib, so zoomed-in redraws cost what is on screen
+        # float32 limits keep the comparisons in single precision
+        min_x, max_x = np.float32(sorted(self.ax.get_xlim()))
+        min_y, max_y = np.float32(sorted(self.ax.get_ylim()))
+        bounds = self.pad_bounds
+        visible = ((bounds[:, 2] >= min_x) & (bounds[:, 0] <= max_x) &
+                   (bounds[:, 3] >= min_y) & (bounds[:, 1] <= max_y))
+        # Nothing to rebuild while the same pads stay in view, e.g. when
+        # panning around a fully visible board
+        if self._visible is not None and np.array_equal(visible, self._visible):
+            return
+        self._visible = visible
+
+        self._remove_pad_collections()
+        volumes = self._volumes
+        norm = self._norm
+        cmap = self._cmap
+
+        # Round pads are drawn straight from the arrays as one collection of
+        # ellipses sized in data units
+        circles = self._is_circle & visible
+        if circles.any():
+            diameters = 2 * self._radii[circles]
+            circle_collection = EllipseCollection(
+                diameters,
+                diameters,
+                0,
+                units='xy',
+                offsets=self._centres[circles],
+                offset_transform=self.ax.transData,
+                cmap=cmap,
+                norm=norm,
+                alpha=0.6
+            )
+            circle_collection.set_array(volumes[circles])
+            self.ax.add_collection(circle_collection, autolim=False)
+            self._pad_collections.append(circle_collection)
+
+        # Rectangles and polygons share one collection of outlines, taken
+        # from the vertices precomputed in set_pads
+        rectangles = self._is_rectangle & visible
+        outlines = self._rect_outlines[self._rect_rows[rectangles]]
+        outline_volumes = volumes[rectangles]
+
+        polygons = np.flatnonzero(self._is_polygon & visible).tolist()
+        polygon_outlines = [self._polygon_outlines[index] for index in polygons]
+        polygon_volumes = volumes[polygons]
+
+        if polygon_outlines:
+            outlines = list(outlines) + polygon_outlines
+            outline_volumes = np.concatenate((outline_volumes, polygon_volumes))
+
+        if len(outlines):
+            collection = PolyCollection(outlines, cmap=cmap, norm=norm, alpha=0.6)
+            collection.set_array(outline_volumes)
+            self.ax.add_collection(collection, autolim=False)
+            self._pad_collections.append(collection)
+
     def _draw_pads(self):
-        """Draw all pads on the plot"""
-        logging.info("Drawing pads...")
-        self.ax.clear()
-        self._setup_plot()
+        """Reset the plot and colour scale for the current pads"""
+        logger.info("Drawing pads...")
+        # Only the previous pads are removed; the axes, grid and margins set
+        # up by _setup_plot stay in place between loads
+        self._remove_pad_collections()
+        self._visible = None
         
         if not self.pads:
-            logging.warning("No pads to draw")
-            self.canvas.draw()
+            logger.warning("No pads to draw")
+            self.canvas.draw_idle()
             return
         
         # Calculate volume range for color mapping
-        volumes = [pad.volume for pad in self.pads]
-        min_volume = min(volumes)
-        max_volume = max(volumes)
-        norm = mcolors.Normalize(vmin=min_volume, vmax=max_volume)
-        cmap = mcolors.LinearSegmentedColormap.from_list("", ["lightblue", "darkblue"])
-        
-        # Create colorbar axes
-        if hasattr(self, '_colorbar'):
-            self._colorbar.remove()
-        cax = self.figure.add_axes([0.92, 0.1, 0.02, 0.8])
-        
-        for pad in self.pads:
-            try:
-                logging.debug(f"Drawing pad {pad.id} of type {pad.shape_type}")
-                # Get color based on volume
-                color = cmap(norm(pad.volume))
-                
-                if pad.shape_type == 'circle':
-                    # For circles, we need to get the radius from the geometry buffer
-                    if hasattr(pad.geometry, 'radius'):
-                        radius = pad.geometry.radius
-                    else:
-                        # If geometry is a buffer, get its radius
-                        radius = pad.geometry.buffer(0).boundary.distance(pad.geometry.centroid)
-                    
-                    circle = Circle(
-                        pad.coordinates,
-                        radius,
-                        fill=True,
-                        alpha=0.6,
-                        fc=color
-                    )
-                    self.ax.add_patch(circle)
-                    
-                elif pad.shape_type in ['rectangle', 'polygon']:
-                    bounds = pad.geometry.bounds
-                    if pad.shape_type == 'rectangle':
-                        patch = Rectangle(
-                            (bounds[0], bounds[1]),
-                            bounds[2] - bounds[0],
-                            bounds[3] - bounds[1],
-                            fill=True,
-                            alpha=0.6,
-                            fc=color
-                        )
-                    else:
-                        coords = np.array(pad.geometry.exterior.coords)
-                        patch = Polygon(
-                            coords,
-                            fill=True,
-                            alpha=0.6,
-                            fc=color
-                        )
-                    self.ax.add_patch(patch)
-                    
-            except Exception as e:
-                logging.error(f"Error drawing pad {pad.id}: {str(e)}")
-        
-        # Add colorbar
-        sm = ScalarMappable(cmap=cmap, norm=norm)
-        sm.set_array([])
-        self._colorbar = self.figure.colorbar(sm, cax=cax, label='Volume (mm³)')
-        
-        # Ensure plot remains centered
+        volumes = self._volumes
+        min_volume = float(volumes.min())
+        max_volume = float(volumes.max())
+        norm = self._norm
+        cmap = self._cmap
+        # Rescale only when the range moved; the colorbar follows the shared norm
+        if (norm.vmin, norm.vmax) != (min_volume, max_volume):
+            if self._colorbar is None:
+                norm.vmin, norm.vmax = min_volume, max_volume
+            else:
+                self._colorbar.mappable.set_clim(min_volume, max_volume)
+        
+        # Add the colorbar once; it shares the norm, so later draws rescale it above
+        if self._colorbar is None:
+            cax = self.figure.add_axes([0.92, 0.1, 0.02, 0.8])
+            sm = ScalarMappable(cmap=cmap, norm=norm)
+            sm.set_array([])
+            self._colorbar = self.figure.colorbar(sm, cax=cax, label='Volume (mm³)')
+        
+        # Ensure plot remains centered. The margins from _setup_plot leave room
+        # for the fixed colorbar axes, so no layout pass is needed per draw
         self.ax.set_aspect('equal')
-        self.figure.tight_layout()
         
-        logging.info("Drawing complete, updating canvas")
-        self.canvas.draw()
+        # Only schedule the render: set_pads follows up with fit_view, which
+        # adds the pads for the final view limits, and both changes should
+        # reach the screen in a single draw
+        logger.debug("Drawing complete, updating canvas")
+        self.canvas.draw_idle()
@@ -1,80 +1,153 @@
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QTableView, QHeaderView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 import pandas as pd
-from typing import List
+import csv
+from typing import List, Optional
 from src.gerber_parser import PadInfo
 import logging
 
-class VolumeTable(QTableWidget):
+logger = logging.getLogger(__name__)
+
+# Column headers, each with the pad value it shows and how that value is displayed
+COLUMNS = ['Pad ID', 'Type', 'Length (mm)', 'Width (mm)', 'Area (mm²)', 'Thickness (µm)', 'Volume (mm³)']
+_COLUMN_VALUES = [
+    lambda pad: pad.id,
+    lambda pad: pad.shape_type,
+    lambda pad: pad.length,
+    lambda pad: pad.width,
+    lambda pad: pad.area,
+    lambda pad: pad.thickness * 1000,
+    lambda pad: pad.volume,
+]
+_COLUMN_FORMATS = ['{}', '{}', '{:.3f}', '{:.3f}', '{:.3f}', '{:.0f}', '{:.3f}']
+
+def _format_row(pad: PadInfo) -> List[str]:
+    """Displayed text of every cell for a pad"""
+    return [fmt.format(value(pad)) for fmt, value in zip(_COLUMN_FORMATS, _COLUMN_VALUES)]
+
+# Looked up once here rather than through the Qt enums on every data() call
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_ALIGN_CENTER = int(Qt.AlignmentFlag.AlignCenter)
+
+class PadTableModel(QAbstractTableModel):
+    """Table model serving pad data to the volume table on demand"""
     def __init__(self):
         super().__init__()
+        self._pads: List[PadInfo] = []
+        # Formatted text per row, filled in the first time a row is shown so
+        # repaints and scrolling reuse it instead of formatting again
+        self._cells: List[Optional[List[str]]] = []
+
+    def set_pads(self, pads: List[PadInfo]):
+        """Replace all rows in a single model reset"""
+        self.beginResetModel()
+        self._pads = list(pads)
+        self._cells = [None] * len(self._pads)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._pads)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        # Qt asks for many roles per paint; only text and alignment are served
+        if role == _DISPLAY_ROLE:
+            row = index.row()
+            cells = self._cells[row]
+            if cells is None:
+                cells = _format_row(self._pads[row])
+                self._cells[row] = cells
+            return cells[index.column()]
+        if role == _ALIGNMENT_ROLE:
+            return _ALIGN_CENTER
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by the underlying pad values of a column"""
+        if not 0 <= column < len(COLUMNS):
+            return
+        self.layoutAboutToBeChanged.emit()
+        # Sort row positions so the cached text moves with its pad
+        value = _COLUMN_VALUES[column]
+        pads = self._pads
+        rows = sorted(range(len(pads)), key=lambda row: value(pads[row]),
+                      reverse=order == Qt.SortOrder.DescendingOrder)
+        self._pads = [pads[row] for row in rows]
+        self._cells = [self._cells[row] for row in rows]
+
+        # Selection and current index follow their pads to the new rows
+        old_indexes = self.persistentIndexList()
+        if old_indexes:
+            new_rows = [0] * len(rows)
+            for new_row, old_row in enumerate(rows):
+                new_rows[old_row] = new_row
+            new_indexes = [self.index(new_rows[index.row()], index.column()) for index in old_indexes]
+            self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def row_text(self, row: int) -> List[str]:
+        """Displayed text of every cell in a row; rows not yet shown are formatted but not cached"""
+        cells = self._cells[row]
+        return cells if cells is not None else _format_row(self._pads[row])
+
+class VolumeTable(QTableView):
+    def __init__(self):
+        super().__init__()
+        self.pad_model = PadTableModel()
+        self.setModel(self.pad_model)
         self._setup_table()
-        
+
     def _setup_table(self):
         """Setup the table structure"""
-        # Set columns
-        columns = ['Pad ID', 'Type', 'Length (mm)', 'Width (mm)', 'Area (mm²)', 'Thickness (µm)', 'Volume (mm³)']
-        self.setColumnCount(len(columns))
-        self.setHorizontalHeaderLabels(columns)
-        
         # Set column widths
         header = self.horizontalHeader()
-        for i in range(len(columns)):
+        for i in range(len(COLUMNS)):
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
-            
-        # Enable sorting
+
+        # Enable sorting, keeping file order until a column is clicked
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.setSortingEnabled(True)
-        
+
     def update_data(self, pads: List[PadInfo]):
         """Update table with new pad data"""
-        logging.info(f"Updating volume table with {len(pads)} pads")
-        self.setSortingEnabled(False)
-        self.setRowCount(0)
-        
-        for pad in pads:
-            row = self.rowCount()
-            self.insertRow(row)
-            
-            # Add items
-            self.setItem(row, 0, QTableWidgetItem(str(pad.id)))
-            self.setItem(row, 1, QTableWidgetItem(pad.shape_type))
-            self.setItem(row, 2, QTableWidgetItem(f"{pad.length:.3f}"))
-            self.setItem(row, 3, QTableWidgetItem(f"{pad.width:.3f}"))
-            self.setItem(row, 4, QTableWidgetItem(f"{pad.area:.3f}"))
-            self.setItem(row, 5, QTableWidgetItem(f"{pad.thickness*1000:.0f}"))
-            self.setItem(row, 6, QTableWidgetItem(f"{pad.volume:.3f}"))
-            
-            # Set alignment
-            for col in range(self.columnCount()):
-                item = self.item(row, col)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                
-        self.setSortingEnabled(True)
-        logging.info("Volume table update complete")
-        
+        logger.info(f"Updating volume table with {len(pads)} pads")
+        # Hold repaints so the model reset and the re-sort reach the screen
+        # as one update
+        self.setUpdatesEnabled(False)
+        try:
+            self.pad_model.set_pads(pads)
+            # Keep any column order the user picked
+            header = self.horizontalHeader()
+            self.pad_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+        finally:
+            self.setUpdatesEnabled(True)
+        logger.info("Volume table update complete")
+
     def export_data(self, filepath: str):
         """Export table data to file"""
         try:
-            logging.info(f"Exporting data to {filepath}")
-            # Create DataFrame from table data
-            data = []
-            for row in range(self.rowCount()):
-                row_data = {}
-                for col in range(self.columnCount()):
-                    header = self.horizontalHeaderItem(col).text()
-                    item = self.item(row, col)
-                    row_data[header] = item.text() if item else ""
-                data.append(row_data)
-                
-            df = pd.DataFrame(data)
-            
+            logger.info(f"Exporting data to {filepath}")
+            rows = (self.pad_model.row_text(row) for row in range(self.pad_model.rowCount()))
+
             # Export based on file extension
             if filepath.endswith('.xlsx'):
-                df.to_excel(filepath, index=False)
+                pd.DataFrame(rows, columns=COLUMNS).to_excel(filepath, index=False)
             else:  # Default to CSV
-                df.to_csv(filepath, index=False)
-                
-            logging.info("Data export complete")
+                # Rows are streamed straight to the file without building a DataFrame
+                with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f, lineterminator='\n')
+                    writer.writerow(COLUMNS)
+                    writer.writerows(rows)
+
+            logger.info("Data export complete")
         except Exception as e:
-            logging.error(f"Error exporting data: {str(e)}")
+            logger.error(f"Error exporting data: {str(e)}")
             raise